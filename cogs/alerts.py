@@ -13,7 +13,7 @@ from discord.ext import commands
 from config import ALERTDB_PATH
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentAlert:
     id: int
     title: str
@@ -34,33 +34,24 @@ class MemberWhitelistUserView(discord.ui.View):
         panel_id = self.panel['panel_id']
         key = (guild_id, panel_id)
 
-        selected_members = select.values
-        added_names = []
+        members = [m for m in select.values if not m.bot]
+        added_names = [m.display_name for m in members]
 
         async with self.cog.acquire_db() as db:
             await db.execute(
                 "UPDATE autoreact_panels SET member_whitelist = 1 WHERE guild_id = ? AND panel_id = ?",
                 key
             )
-            self.panel['member_whitelist'] = 1
-
-            for member in selected_members:
-                if member.bot:
-                    continue
-
-                await db.execute(
-                    "INSERT OR REPLACE INTO autoreact_whitelist (guild_id, panel_id, user_id) VALUES (?, ?, ?)",
-                    (guild_id, panel_id, member.id)
-                )
-
-                if key not in self.cog.whitelist_cache:
-                    self.cog.whitelist_cache[key] = set()
-                self.cog.whitelist_cache[key].add(member.id)
-
-                added_names.append(member.display_name)
-
+            await db.executemany(
+                "INSERT OR REPLACE INTO autoreact_whitelist (guild_id, panel_id, user_id) VALUES (?, ?, ?)",
+                [(guild_id, panel_id, m.id) for m in members]
+            )
             await db.commit()
 
+        self.panel['member_whitelist'] = 1
+        if members:
+            self.cog.whitelist_cache.setdefault(key, set()).update(m.id for m in members)
+
         if not added_names:
             return await interaction.response.send_message("No valid (non-bot) members were added.", ephemeral=True)
 
@@ -75,10 +66,11 @@ class AutoReact(commands.Cog):
         self.db_pool: Optional[asyncio.Queue] = None
 
         self.panel_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self.guild_panels: Dict[int, Dict[int, Dict[str, Any]]] = {}
+        self.active_channel_ids: Set[int] = set()
         self.whitelist_cache: Dict[Tuple[int, int], Set[int]] = {}
 
         self._reaction_queue: asyncio.Queue[Tuple[discord.Message, str]] = asyncio.Queue()
-        self._reaction_semaphore = asyncio.Semaphore(5)
         self._reaction_task: Optional[asyncio.Task] = None
 
     async def cog_load(self):
@@ -147,18 +139,20 @@ class AutoReact(commands.Cog):
 
     async def populate_caches(self):
         self.panel_cache.clear()
+        self.guild_panels.clear()
         self.whitelist_cache.clear()
 
         async with self.acquire_db() as db:
             async with db.execute("SELECT * FROM autoreact_panels") as cursor:
+                cursor.row_factory = aiosqlite.Row
                 rows = await cursor.fetchall()
-                cols = [c[0] for c in cursor.description]
                 for row in rows:
-                    data = dict(zip(cols, row))
+                    data = dict(row)
                     key = (data['guild_id'], data['panel_id'])
                     # Convert stored pipe string back to list for cache efficiency
                     data['emoji_list'] = self.deserialize_emojis(data['emoji'])
                     self.panel_cache[key] = data
+                    self.guild_panels.setdefault(data['guild_id'], {})[data['panel_id']] = data
 
             async with db.execute("SELECT guild_id, panel_id, user_id FROM autoreact_whitelist") as cursor:
                 rows = await cursor.fetchall()
@@ -168,6 +162,14 @@ class AutoReact(commands.Cog):
                         self.whitelist_cache[key] = set()
                     self.whitelist_cache[key].add(u_id)
 
+        self.rebuild_active_channels()
+
+    def find_panel(self, guild_id: int, name: str) -> Optional[Dict[str, Any]]:
+        return next((p for p in self.guild_panels.get(guild_id, {}).values() if p['name'] == name), None)
+
+    def rebuild_active_channels(self):
+        self.active_channel_ids = {p['channel_id'] for p in self.panel_cache.values() if p['is_active']}
+
     def parse_emoji_input(self, emoji_input: str) -> List[str]:
         if not emoji_input: return []
         tokens = []
@@ -210,8 +212,8 @@ class AutoReact(commands.Cog):
                 name=f"{data['name']} ({data['panel_id']})",
                 value=data['name']
             )
-            for (g_id, p_id), data in self.panel_cache.items()
-            if g_id == interaction.guild_id and current_lower in data['name'].lower()
+            for data in self.guild_panels.get(interaction.guild_id, {}).values()
+            if current_lower in data['name'].lower()
         ]
         return choices[:25]
 
@@ -234,12 +236,11 @@ class AutoReact(commands.Cog):
         if not (0 < len(parsed) <= 3):
             return await interaction.response.send_message("Provide 1-3 valid emojis.", ephemeral=True)
 
-        guild_panels = [p for (g, pid), p in self.panel_cache.items() if g == interaction.guild.id]
+        guild_panels = self.guild_panels.get(interaction.guild.id, {})
         if len(guild_panels) >= 20:
             return await interaction.response.send_message("Maximum of 20 panels reached.", ephemeral=True)
 
-        existing_ids = {p['panel_id'] for p in guild_panels}
-        panel_id = next(i for i in range(1, 24) if i not in existing_ids)
+        panel_id = next(i for i in range(1, 24) if i not in guild_panels)
 
         now = time.time()
         serialized = self.serialize_emojis(parsed)
@@ -251,62 +252,81 @@ class AutoReact(commands.Cog):
                              ''', (interaction.guild.id, panel_id, name, serialized, channel.id, now))
             await db.commit()
 
-        self.panel_cache[(interaction.guild.id, panel_id)] = {
+        data = {
             "guild_id": interaction.guild.id, "panel_id": panel_id, "name": name,
             "emoji": serialized, "emoji_list": parsed, "channel_id": channel.id,
             "is_active": 1, "member_whitelist": 0, "image_only_mode": 0, "started_at": now
         }
+        self.panel_cache[(interaction.guild.id, panel_id)] = data
+        self.guild_panels.setdefault(interaction.guild.id, {})[panel_id] = data
+        self.active_channel_ids.add(channel.id)
 
         await interaction.response.send_message(embed=discord.Embed(title="Panel created successfully", description=f"Panel **{name}** created and started successfully."), ephemeral=True)
 
     @panel_group.command(name="list", description="View all autoreact panels")
     @app_commands.check(slash_mod_check)
     async def autoreact_panels(self, interaction: discord.Interaction):
-        guild_panels = [p for (g, pid), p in self.panel_cache.items() if g == interaction.guild.id]
+        guild_panels = self.guild_panels.get(interaction.guild.id)
         if not guild_panels:
             return await interaction.response.send_message("No panels found.", ephemeral=True)
 
         embed = discord.Embed(title="Your AutoReact Panels", color=0x337fd5)
-        desc = ""
-        for p in sorted(guild_panels, key=lambda x: x['panel_id']):
+        parts = []
+        append = parts.append
+        for p in sorted(guild_panels.values(), key=lambda x: x['panel_id']):
             chan = f"<#{p['channel_id']}>"
             emojis = self.format_emojis_for_display(p['emoji_list'])
             status = '🟢 Active' if p['is_active'] else '🔴 Inactive'
             wl_count = len(self.whitelist_cache.get((p['guild_id'], p['panel_id']), [])) if p[
                 'member_whitelist'] else "All users"
 
-            desc += f"## {p['panel_id']}. {p['name']}\n"
-            desc += f"* **Emoji(s):** {emojis}\n* **Channel:** {chan}\n* **Status:** {status}\n"
-            desc += f"* **Target:** {wl_count}\n* **Mode:** {'Image-only' if p['image_only_mode'] else 'All'}\n\n"
+            append(f"## {p['panel_id']}. {p['name']}\n")
+            append(f"* **Emoji(s):** {emojis}\n* **Channel:** {chan}\n* **Status:** {status}\n")
+            append(f"* **Target:** {wl_count}\n* **Mode:** {'Image-only' if p['image_only_mode'] else 'All'}\n\n")
 
-        embed.description = desc
+        embed.description = "".join(parts)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @panel_group.command(name="start", description="Start a panel")
     @app_commands.check(slash_mod_check)
     @app_commands.autocomplete(name=panel_name_autocomplete)
     async def start_autoreact_panel(self, interaction: discord.Interaction, name: str):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items() if g == interaction.guild_id and p['name'] == name), None)
+        target = self.find_panel(interaction.guild_id, name)
         if not target: return await interaction.response.send_message("Panel not found.", ephemeral=True)
 
         now = time.time()
-        async with self.acquire_db() as db:
-            await db.execute(
-                "UPDATE autoreact_panels SET is_active = 1, started_at = ? WHERE guild_id = ? AND panel_id = ?",
-                (now, interaction.guild_id, target['panel_id']))
-            await db.commit()
-
+        previous = (target['is_active'], target['started_at'])
         target['is_active'] = 1
         target['started_at'] = now
-        await interaction.response.send_message(embed=discord.Embed(title="AutoReact Stopped",description=f"Panel **{name}** has been sstarted successfully.", color=discord.Color.green()), ephemeral=True)
+        self.active_channel_ids.add(target['channel_id'])
+
+        async def write_start():
+            async with self.acquire_db() as db:
+                await db.execute(
+                    "UPDATE autoreact_panels SET is_active = 1, started_at = ? WHERE guild_id = ? AND panel_id = ?",
+                    (now, interaction.guild_id, target['panel_id']))
+                await db.commit()
+
+        write_result, reply_result = await asyncio.gather(
+            write_start(),
+            interaction.response.send_message(embed=discord.Embed(title="AutoReact Stopped",description=f"Panel **{name}** has been sstarted successfully.", color=discord.Color.green()), ephemeral=True),
+            return_exceptions=True
+        )
+        # Only a failed write undoes the start; a failed reply leaves the committed state alone
+        if isinstance(write_result, BaseException):
+            target['is_active'], target['started_at'] = previous
+            self.rebuild_active_channels()
+            if not isinstance(reply_result, BaseException):
+                await interaction.followup.send(f"Failed to start **{name}**.", ephemeral=True)
+            raise write_result
+        if isinstance(reply_result, BaseException):
+            raise reply_result
 
     @panel_group.command(name="stop", description="Stop a panel")
     @app_commands.check(slash_mod_check)
     @app_commands.autocomplete(name=panel_name_autocomplete)
     async def stop_autoreact_panel(self, interaction: discord.Interaction, name: str):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items() if g == interaction.guild_id and p['name'] == name), None)
+        target = self.find_panel(interaction.guild_id, name)
         if not target: return await interaction.response.send_message("Panel not found.", ephemeral=True)
 
         async with self.acquire_db() as db:
@@ -315,14 +335,14 @@ class AutoReact(commands.Cog):
             await db.commit()
 
         target['is_active'] = 0
+        self.rebuild_active_channels()
         await interaction.response.send_message(f"Stopped **{name}**.", ephemeral=True)
 
     @panel_group.command(name="delete", description="Delete a panel")
     @app_commands.check(slash_mod_check)
     @app_commands.autocomplete(name=panel_name_autocomplete)
     async def delete_autoreact_panel(self, interaction: discord.Interaction, name: str):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items() if g == interaction.guild_id and p['name'] == name), None)
+        target = self.find_panel(interaction.guild_id, name)
         if not target: return await interaction.response.send_message("Panel not found.", ephemeral=True)
 
         key = (interaction.guild_id, target['panel_id'])
@@ -332,7 +352,9 @@ class AutoReact(commands.Cog):
             await db.commit()
 
         self.panel_cache.pop(key, None)
+        self.guild_panels.get(interaction.guild_id, {}).pop(target['panel_id'], None)
         self.whitelist_cache.pop(key, None)
+        self.rebuild_active_channels()
         await interaction.response.send_message(
 
             embed=discord.Embed(title="AutoReact Panel Deleted", description=f"Deleted panel **{name}**.", color=discord.Color.green()), ephemeral=True)
@@ -341,8 +363,7 @@ class AutoReact(commands.Cog):
     @app_commands.check(slash_mod_check)
     @app_commands.autocomplete(name=panel_name_autocomplete)
     async def edit_autoreact_panel(self, interaction: discord.Interaction, name: str, emoji: Optional[str] = None, channel: Optional[discord.TextChannel] = None, new_name: Optional[str] = None):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items() if g == interaction.guild_id and p['name'] == name), None)
+        target = self.find_panel(interaction.guild_id, name)
         if not target: return await interaction.response.send_message("Panel not found.", ephemeral=True)
 
         updates = []
@@ -371,6 +392,8 @@ class AutoReact(commands.Cog):
                              params)
             await db.commit()
 
+        if channel:
+            self.rebuild_active_channels()
         await interaction.response.send_message(embed=discord.Embed(title="AutoReact Panel Updated", description=f"Updated panel **{name}**.", color=discord.Color.green()), ephemeral=True)
 
     @member_group.command(name="whitelist", description="Manage whitelisted members for a panel")
@@ -378,11 +401,7 @@ class AutoReact(commands.Cog):
     @app_commands.autocomplete(name=panel_name_autocomplete)
     @app_commands.describe(name="The name of the panel to manage")
     async def autoreact_member_whitelist(self, interaction: discord.Interaction, name: str):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items()
-             if g == interaction.guild_id and p['name'] == name),
-            None
-        )
+        target = self.find_panel(interaction.guild_id, name)
 
         if not target:
             return await interaction.response.send_message("Panel not found.", ephemeral=True)
@@ -403,11 +422,7 @@ class AutoReact(commands.Cog):
     @app_commands.autocomplete(name=panel_name_autocomplete)
     @app_commands.describe(name="The name of the panel", enabled="Whether image-only mode should be on or off")
     async def autoreact_image_only_mode(self, interaction: discord.Interaction, name: str, enabled: bool):
-        target = next(
-            (p for (g, pid), p in self.panel_cache.items()
-             if g == interaction.guild_id and p['name'] == name),
-            None
-        )
+        target = self.find_panel(interaction.guild_id, name)
 
         if not target:
             return await interaction.response.send_message("Panel not found.", ephemeral=True)
@@ -436,12 +451,17 @@ class AutoReact(commands.Cog):
     async def on_message(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
-        for (g_id, p_id), panel in self.panel_cache.items():
-            if g_id != message.guild.id or panel['channel_id'] != message.channel.id or not panel['is_active']:
+        if message.channel.id not in self.active_channel_ids:
+            return
+        has_img = None
+        g_id = message.guild.id
+        for p_id, panel in self.guild_panels.get(g_id, {}).items():
+            if panel['channel_id'] != message.channel.id or not panel['is_active']:
                 continue
 
             if panel['image_only_mode']:
-                has_img = bool(message.attachments) or any(e.type == 'image' for e in message.embeds)
+                if has_img is None:
+                    has_img = bool(message.attachments) or any(e.type == 'image' for e in message.embeds)
                 if not has_img: continue
 
             if panel['member_whitelist']:
@@ -454,11 +474,10 @@ class AutoReact(commands.Cog):
         while True:
             try:
                 message, em = await self._reaction_queue.get()
-                async with self._reaction_semaphore:
-                    try:
-                        await message.add_reaction(em)
-                    except:
-                        pass
+                try:
+                    await message.add_reaction(em)
+                except:
+                    pass
                 self._reaction_queue.task_done()
                 await asyncio.sleep(0.1)
             except asyncio.CancelledError:
@@ -111,7 +111,8 @@ class BatteryMonitor(commands.Cog):
                     choices.append(app_commands.Choice(name=f"#{channel.name} in {channel.guild.name}", value=str(channel.id)))
 
         if current:
-            return [choice for choice in choices if current.lower() in choice.name.lower()]
+            current_lower = current.lower()
+            return [choice for choice in choices if current_lower in choice.name.lower()]
         return choices
 
     battery = app_commands.Group(name="battery", description="Commands for the battery monitor.")
@@ -1,5 +1,5 @@
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib.machinery import all_suffixes
 from typing import Optional, List, Dict, Set
 import discord
@@ -15,7 +15,7 @@ from discord.ui import TextDisplay
 from config import GDB_PATH
 from utils.time import get_duration_to_seconds, get_now_plus_seconds_unix
 
-@dataclass
+@dataclass(slots=True)
 class GiveawayDraft:
     guild_id: int
     channel_id: int
@@ -23,10 +23,10 @@ class GiveawayDraft:
     winners: int
     end_time: int # Unix timestamp
     host_id: Optional[int] = None
-    required_roles: List[int] = None
+    required_roles: List[int] = field(default_factory=list)
     required_behaviour: int = 0 # 0 = All, 1 = One
-    blacklisted_roles: List[int] = None
-    extra_entries: List[int] = None
+    blacklisted_roles: List[int] = field(default_factory=list)
+    extra_entries: List[int] = field(default_factory=list)
     winner_role: Optional[int] = None
     image: Optional[str] = None
     thumbnail: Optional[str] = None
@@ -47,26 +47,27 @@ class PrivateView(discord.ui.View):
         return True
 
 class GiveawayEditSelect(discord.ui.Select):
+    _OPTIONS = (
+        discord.SelectOption(label="1. Prize", value="prize", description="Change the prize being given away."),
+        discord.SelectOption(label="2. Duration", value="duration", description="Change how long the giveaway lasts (e.g., 1h, 2d)."),
+        discord.SelectOption(label="3. Winners Count", value="winners", description="Change the number of winners."),
+        discord.SelectOption(label="4. Channel", value="channel", description="Change where the giveaway is posted."),
+        discord.SelectOption(label="5. Giveaway Host", value="host", description="The host name to be shown in the giveaway Embed."),
+        discord.SelectOption(label="6. Extra Entries Role", value="extra", description="Roles that will give extra entries. Each role gives +1 entries."),
+        discord.SelectOption(label="7. Required Roles", value="required", description="Roles required to participate."),
+        discord.SelectOption(label="8. Required Roles Behaviour", value="behavior", description="The behavior of the required roles feature."),
+        discord.SelectOption(label="9. Winner Role", value="winner_role", description="Role given to winners."),
+        discord.SelectOption(label="10. Blacklisted Roles", value="blacklist", description="Roles that cannot participate."),
+        discord.SelectOption(label="11. Image", value="image", description="Provide a valid URL for the Embed image."),
+        discord.SelectOption(label="12. Thumbnail", value="thumbnail", description="Provide a valid URL for the Embed thumbnail."),
+        discord.SelectOption(label="13. Colour", value="color", description="Set embed color (Hex or Valid Name)."),
+    )
+
     def __init__(self, cog, draft: GiveawayDraft, parent_view):
         self.cog = cog
         self.draft = draft
         self.parent_view = parent_view
-        options = [
-            discord.SelectOption(label="1. Prize", value="prize", description="Change the prize being given away."),
-            discord.SelectOption(label="2. Duration", value="duration", description="Change how long the giveaway lasts (e.g., 1h, 2d)."),
-            discord.SelectOption(label="3. Winners Count", value="winners", description="Change the number of winners."),
-            discord.SelectOption(label="4. Channel", value="channel", description="Change where the giveaway is posted."),
-            discord.SelectOption(label="5. Giveaway Host", value="host", description="The host name to be shown in the giveaway Embed."),
-            discord.SelectOption(label="6. Extra Entries Role", value="extra", description="Roles that will give extra entries. Each role gives +1 entries."),
-            discord.SelectOption(label="7. Required Roles", value="required", description="Roles required to participate."),
-            discord.SelectOption(label="8. Required Roles Behaviour", value="behavior", description="The behavior of the required roles feature."),
-            discord.SelectOption(label="9. Winner Role", value="winner_role", description="Role given to winners."),
-            discord.SelectOption(label="10. Blacklisted Roles", value="blacklist", description="Roles that cannot participate."),
-            discord.SelectOption(label="11. Image", value="image", description="Provide a valid URL for the Embed image."),
-            discord.SelectOption(label="12. Thumbnail", value="thumbnail", description="Provide a valid URL for the Embed thumbnail."),
-            discord.SelectOption(label="13. Colour", value="color", description="Set embed color (Hex or Valid Name).")
-        ]
-        super().__init__(placeholder="Select a setting to customize...", options=options)
+        super().__init__(placeholder="Select a setting to customize...", options=list(self._OPTIONS))
 
     async def callback(self, interaction: discord.Interaction):
         value = self.values[0]
@@ -245,9 +246,7 @@ class ParticipantPaginator(discord.ui.View):
             entries = 1
             member = self.guild.get_member(uid)
             if member and extra_roles:
-                for role_id in extra_roles:
-                    if any(r.id == role_id for r in member.roles):
-                        entries += 1
+                entries += sum(1 for role_id in extra_roles if member.get_role(role_id))
             data.append({'id': uid, 'entries': entries})
 
         return sorted(data, key=lambda x: (x['entries'], x['id']), reverse=True)
@@ -773,10 +772,10 @@ class Giveaways(commands.Cog):
 
         async with self.acquire_db() as db:
             async with db.execute("SELECT * FROM giveaways WHERE ended = 0") as cursor:
+                cursor.row_factory = aiosqlite.Row
                 rows = await cursor.fetchall()
-                columns = [column[0] for column in cursor.description]
                 for row in rows:
-                    data = dict(zip(columns, row))
+                    data = dict(row)
                     giveaway_id = data["giveaway_id"]
                     self.giveaway_cache[giveaway_id] = data
                     self.participant_cache[giveaway_id] = set()
@@ -808,10 +807,10 @@ class Giveaways(commands.Cog):
         if not g:
             async with self.acquire_db() as db:
                 async with db.execute("SELECT * FROM giveaways WHERE giveaway_id = ? AND guild_id = ?", (giveaway_id, guild_id)) as cursor:
-                    rows = await cursor.fetchall()
-                    if not rows: return
-                    columns = [column[0] for column in cursor.description]
-                    g = dict(zip(columns, rows))
+                    cursor.row_factory = aiosqlite.Row
+                    row = await cursor.fetchone()
+                    if not row: return
+                    g = dict(row)
                     self.giveaway_cache[giveaway_id] = g
         if g.get('ended') == 1:
             return
@@ -977,9 +976,9 @@ class Giveaways(commands.Cog):
         return embed
 
     async def save_giveaway(self, draft: GiveawayDraft, message_id: int, giveaway_id: int):
-        req_roles = ",".join(map(str, draft.required_roles)) if draft.required_roles else ""
-        black_roles = ",".join(map(str, draft.blacklisted_roles)) if draft.blacklisted_roles else ""
-        extra_roles = ",".join(map(str, draft.extra_entries)) if draft.extra_entries else ""
+        req_roles = ",".join(map(str, draft.required_roles))
+        black_roles = ",".join(map(str, draft.blacklisted_roles))
+        extra_roles = ",".join(map(str, draft.extra_entries))
 
         data = {
             "guild_id": draft.guild_id,
@@ -1022,9 +1021,10 @@ class Giveaways(commands.Cog):
                     rows = await cursor.fetchall()
                     data_source = [(row[0], {"prize": row[1]}) for row in rows]
 
+        current_lower = current.lower()
         for i, (giveaway_id, data) in enumerate(data_source, 1):
             label = f"{i}. {data['prize']}: {giveaway_id}"
-            if current.lower() in label.lower():
+            if current_lower in label.lower():
                 choices.append(app_commands.Choice(name=label, value=str(giveaway_id)))
 
         return choices[:25]
@@ -235,10 +235,11 @@ async def _get_names_autocomplete(interaction: discord.Interaction, current: str
         return []
 
     user_notes = cog.notes_cache.get(interaction.user.id, {})
+    current_lower = current.lower()
     choices = [
         app_commands.Choice(name=name, value=name)
         for name in user_notes.keys()
-        if current.lower() in name.lower()
+        if current_lower in name.lower()
     ]
     return choices[:25]
 
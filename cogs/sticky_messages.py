@@ -1,15 +1,19 @@
 import asyncio
+from collections import deque
+from dataclasses import dataclass, replace
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 import aiosqlite
-from typing import Optional, Dict, List, Any
+import logging
+from typing import Optional, Dict, List, Any, Tuple, Set
 import time
 from contextlib import asynccontextmanager
 
 from config import STICKYDB_PATH
 from utils.checks import slash_mod_check
 
+log = logging.getLogger(__name__)
 
 
 def parse_color(value: str) -> Optional[discord.Color]:
@@ -44,6 +48,30 @@ def parse_color(value: str) -> Optional[discord.Color]:
     return None
 
 
+@dataclass(frozen=True, slots=True)
+class StickyPanel:
+    guild_id: int
+    panel_id: int
+    title: str
+    description: Optional[str] = None
+    footer: Optional[str] = None
+    image_url: Optional[str] = None
+    embed_color: Optional[str] = None
+    channel_id: Optional[int] = None
+    last_message_id: Optional[int] = None
+    conversation_duration: int = 10
+    include_bots: int = 1
+    embed_color_int: Optional[int] = None
+
+
+PANEL_COLUMNS = ("guild_id, panel_id, title, description, footer, image_url, embed_color, channel_id, "
+                 "last_message_id, conversation_duration, include_bots, embed_color_int")
+
+SELECT_PANELS_SQL = f"SELECT {PANEL_COLUMNS} FROM sticky_panels"
+INSERT_PANEL_SQL = f"INSERT INTO sticky_panels ({PANEL_COLUMNS}) VALUES ({', '.join('?' * 12)})"
+UPDATE_LAST_MESSAGE_SQL = "UPDATE sticky_panels SET last_message_id = ? WHERE guild_id = ? AND panel_id = ?"
+
+
 class PrivateLayoutView(discord.ui.LayoutView):
     def __init__(self, user, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -125,16 +153,16 @@ class EditPage(PrivateLayoutView):
         self.clear_items()
         p = self.panel_data
         container = discord.ui.Container()
-        container.add_item(discord.ui.TextDisplay(f"## Edit: {p['title']}"))
+        container.add_item(discord.ui.TextDisplay(f"## Edit: {p.title}"))
         container.add_item(discord.ui.Separator())
 
-        bots_enabled = p.get('include_bots', 1) == 1
+        bots_enabled = p.include_bots == 1
         details = (
-            f"**Channel:** <#{p['channel_id']}>\n"
-            f"**Color:** `{p.get('embed_color') or 'Default'}`\n"
-            f"**Duration:** `{p.get('conversation_duration', 10)}s`\n"
+            f"**Channel:** <#{p.channel_id}>\n"
+            f"**Color:** `{p.embed_color or 'Default'}`\n"
+            f"**Duration:** `{p.conversation_duration}s`\n"
             f"**Include Bots:** `{'Yes' if bots_enabled else 'No'}`\n"
-            f"**Description:** {p.get('description') or '*None*'}"
+            f"**Description:** {p.description or '*None*'}"
         )
         container.add_item(discord.ui.TextDisplay(details))
         container.add_item(discord.ui.Separator())
@@ -169,18 +197,18 @@ class EditPage(PrivateLayoutView):
         self.add_item(container)
 
     async def edit_message_callback(self, interaction: discord.Interaction):
-        modal = StickySetupModal(self.cog, self.guild_id, self.panel_data['channel_id'], is_edit=True,
-                                 original_title=self.panel_data['title'])
+        modal = StickySetupModal(self.cog, self.guild_id, self.panel_data.channel_id, is_edit=True,
+                                 original_title=self.panel_data.title)
         await interaction.response.send_modal(modal)
 
     async def edit_channel_callback(self, interaction: discord.Interaction):
         view = ChannelSelectView(self.user, self.cog, self.guild_id, is_rebind=True,
-                                 panel_title=self.panel_data['title'])
+                                 panel_title=self.panel_data.title)
         await interaction.response.send_message(view=view,
                                                 ephemeral=True)
 
     async def delete_callback(self, interaction: discord.Interaction):
-        view = DestructiveConfirmationView(self.user, self.panel_data['title'], self.cog, self.guild_id)
+        view = DestructiveConfirmationView(self.user, self.panel_data.title, self.cog, self.guild_id)
         await interaction.response.send_message(view=view)
 
     async def back_callback(self, interaction: discord.Interaction):
@@ -188,22 +216,24 @@ class EditPage(PrivateLayoutView):
         await interaction.response.edit_message(view=view)
 
     async def edit_duration_callback(self, interaction: discord.Interaction):
-        modal = DurationModal(self.cog, self.guild_id, self.panel_data['title'], parent_view=self)
+        modal = DurationModal(self.cog, self.guild_id, self.panel_data.title, parent_view=self)
         await interaction.response.send_modal(modal)
 
     async def toggle_bots_callback(self, interaction: discord.Interaction):
-        title = self.panel_data['title']
+        title = self.panel_data.title
         panel = self.cog.panel_cache[self.guild_id][title]
 
-        new_val = 0 if panel.get('include_bots', 1) else 1
+        new_val = 0 if panel.include_bots else 1
 
         async with self.cog.acquire_db() as db:
             await db.execute("UPDATE sticky_panels SET include_bots = ? WHERE guild_id = ? AND title = ?",
                              (new_val, self.guild_id, title))
             await db.commit()
 
-        panel['include_bots'] = new_val
-        self.panel_data['include_bots'] = new_val
+        # Re-read after the await, a repost may have stored a newer last_message_id meanwhile
+        panel = replace(self.cog.panel_cache[self.guild_id][title], include_bots=new_val)
+        self.cog.store_panel(panel)
+        self.panel_data = panel
 
         self.build_layout()
         await interaction.response.edit_message(view=self)
@@ -243,8 +273,8 @@ class ManagePage(PrivateLayoutView):
             container.add_item(discord.ui.TextDisplay("*No sticky messages found.*"))
         else:
             for idx, panel in enumerate(panels, start_idx + 1):
-                p_title = panel['title']
-                chan_id = panel['channel_id']
+                p_title = panel.title
+                chan_id = panel.channel_id
 
                 btn_edit = discord.ui.Button(label="Edit", style=discord.ButtonStyle.secondary)
                 btn_edit.callback = self.create_edit_callback(panel)
@@ -377,9 +407,9 @@ class ChannelSelectView(PrivateLayoutView):
         selected_channel = self.select.values[0]
 
         if self.is_rebind:
-            panel = self.cog.panel_cache[self.guild_id][self.panel_title]
-            old_channel_id = panel['channel_id']
-            panel['channel_id'] = selected_channel.id
+            # A queued last_message_id flush would overwrite the NULL written below, drop it before and after the await
+            pending_key = (self.guild_id, self.cog.panel_cache[self.guild_id][self.panel_title].panel_id)
+            self.cog._pending_message_ids.pop(pending_key, None)
 
             async with self.cog.acquire_db() as db:
                 await db.execute(
@@ -388,8 +418,11 @@ class ChannelSelectView(PrivateLayoutView):
                 )
                 await db.commit()
 
-            self.cog.active_channels.pop(old_channel_id, None)
-            self.cog.active_channels[selected_channel.id] = panel
+            self.cog._pending_message_ids.pop(pending_key, None)
+            old_panel = self.cog.panel_cache[self.guild_id][self.panel_title]
+            panel = replace(old_panel, channel_id=selected_channel.id, last_message_id=None)
+            self.cog.active_channels.pop(old_panel.channel_id, None)
+            self.cog.store_panel(panel)
 
             await interaction.response.send_message(
                 content=f"Moved **{self.panel_title}** to {selected_channel.mention}", ephemeral=True)
@@ -415,7 +448,7 @@ class StickyDashboard(PrivateLayoutView):
     def build_layout(self):
         self.clear_items()
         has_panels = len(self.panels) > 0
-        bots_enabled = self.panels[0].get('include_bots', 1) == 1 if has_panels else True
+        bots_enabled = self.panels[0].include_bots == 1 if has_panels else True
 
         container = discord.ui.Container()
         container.add_item(discord.ui.TextDisplay("## Sticky Messages Dashboard"))
@@ -460,7 +493,7 @@ class PanelSelectView(PrivateLayoutView):
 
     def build_layout(self):
         container = discord.ui.Container()
-        options = [discord.SelectOption(label=p['title'], value=p['title']) for p in self.panels[:25]]
+        options = [discord.SelectOption(label=p.title, value=p.title) for p in self.panels[:25]]
         select = discord.ui.Select(placeholder=self.placeholder, options=options)
         select.callback = self.select_callback
         row = discord.ui.ActionRow()
@@ -495,8 +528,9 @@ class DurationModal(discord.ui.Modal):
                              (val, self.guild_id, self.title_name))
             await db.commit()
 
-        self.cog.panel_cache[self.guild_id][self.title_name]['conversation_duration'] = val
-        self.parent_view.panel_data['conversation_duration'] = val  # Update view's local data
+        panel = replace(self.cog.panel_cache[self.guild_id][self.title_name], conversation_duration=val)
+        self.cog.store_panel(panel)
+        self.parent_view.panel_data = panel  # Update view's local data
 
         self.parent_view.build_layout()
         await interaction.response.edit_message(view=self.parent_view)
@@ -527,71 +561,87 @@ class StickySetupModal(discord.ui.Modal):
         self.add_item(self.image_url_input)
 
         if is_edit:
-            data = cog.panel_cache[guild_id].get(original_title, {})
-            self.color_input.default = data.get('embed_color', '')
-            self.description_input.default = data.get('description', '')
-            self.footer_input.default = data.get('footer', '')
-            self.image_url_input.default = data.get('image_url', '')
+            data = cog.panel_cache[guild_id].get(original_title)
+            if data:
+                self.color_input.default = data.embed_color or ''
+                self.description_input.default = data.description or ''
+                self.footer_input.default = data.footer or ''
+                self.image_url_input.default = data.image_url or ''
 
     async def on_submit(self, interaction: discord.Interaction):
         title = self.title_input.value
         color_val = self.color_input.value
 
-        if color_val and not parse_color(color_val):
+        color = parse_color(color_val) if color_val else None
+        if color_val and not color:
             return await interaction.response.send_message("Invalid color format provided.", ephemeral=True)
+        # Colour names like "random" resolve to a new colour each call, keep them unfixed
+        is_random = color_val.strip().lower() == "random" if color_val else False
+        color_int = color.value if color and not is_random else None
 
         if not self.is_edit and title in self.cog.panel_cache.get(self.guild_id, {}):
             return await interaction.response.send_message("A sticky message with that title already exists.",
                                                            ephemeral=True)
 
-        data = {
-            "guild_id": self.guild_id,
-            "title": title,
-            "embed_color": color_val or None,
-            "description": self.description_input.value or None,
-            "image_url": self.image_url_input.value or None,
-            "footer": self.footer_input.value or None,
-            "channel_id": self.channel_id,
-            "last_message_id": None,
-            "conversation_duration": 10,
-            "include_bots": 1,
-            "panel_id": int(time.time())
-        }
+        description = self.description_input.value or None
+        image_url = self.image_url_input.value or None
+        footer = self.footer_input.value or None
 
-        async with self.cog.acquire_db() as db:
-            if self.is_edit:
-                old_data = self.cog.panel_cache[self.guild_id].pop(self.original_title)
-                data.update({k: v for k, v in old_data.items() if
-                             k not in ["title", "description", "footer", "image_url", "embed_color"]})
-                await db.execute("""UPDATE sticky_panels SET title=?, description=?, footer=?, image_url=?, embed_color=?
-                                    WHERE guild_id=? AND title=?""",
-                                 (title, data['description'], data['footer'], data['image_url'], color_val,
+        if self.is_edit:
+            async with self.cog.acquire_db() as db:
+                await db.execute("""UPDATE sticky_panels SET title=?, description=?, footer=?, image_url=?, embed_color=?,
+                                    embed_color_int=? WHERE guild_id=? AND title=?""",
+                                 (title, description, footer, image_url, color_val, color_int,
                                   self.guild_id, self.original_title))
-                msg = f"Sticky message **{title}** updated."
-            else:
-                cols = ", ".join(data.keys());
-                placeholders = ", ".join(["?"] * len(data))
-                await db.execute(f"INSERT INTO sticky_panels ({cols}) VALUES ({placeholders})", list(data.values()))
-                msg = f"Sticky message **{title}** created!"
-            await db.commit()
-
-        if self.guild_id not in self.cog.panel_cache: self.cog.panel_cache[self.guild_id] = {}
-        self.cog.panel_cache[self.guild_id][title] = data
+                await db.commit()
 
+            # Snapshot after the await so a repost's newer last_message_id isn't overwritten
+            old_data = self.cog.panel_cache[self.guild_id].pop(self.original_title)
+            data = replace(old_data, title=title, description=description, footer=footer,
+                           image_url=image_url, embed_color=color_val or None, embed_color_int=color_int)
+            self.cog.store_panel(data)
+            # Drop the cached embed in the same step, a repost during the await may have rebuilt it from the old panel
+            self.cog.embed_cache.pop((self.guild_id, data.panel_id), None)
+            channel = self.cog.bot.get_channel(data.channel_id)
+            if channel: await self.cog.update_sticky_message(data, channel)
+            return await interaction.response.send_message(f"Sticky message **{title}** updated.", ephemeral=True)
+
+        data = StickyPanel(self.guild_id, int(time.time()), title, description, footer, image_url,
+                           color_val or None, self.channel_id, embed_color_int=color_int)
         channel = self.cog.bot.get_channel(self.channel_id)
-        if channel: await self.cog.update_sticky_message(data, channel)
-        await interaction.response.send_message(msg, ephemeral=True)
+        if channel:
+            try:
+                new_msg = await channel.send(embed=self.cog.build_panel_embed(data))
+            except discord.HTTPException:
+                return await interaction.response.send_message(
+                    f"Failed to send the sticky message in {channel.mention}.", ephemeral=True)
+            data = replace(data, last_message_id=new_msg.id)
+
+        async with self.cog.acquire_db() as db:
+            await db.execute(INSERT_PANEL_SQL,
+                             (data.guild_id, data.panel_id, data.title, data.description, data.footer,
+                              data.image_url, data.embed_color, data.channel_id, data.last_message_id,
+                              data.conversation_duration, data.include_bots, data.embed_color_int))
+            await db.commit()
+
+        self.cog.store_panel(data)
+        await interaction.response.send_message(f"Sticky message **{title}** created!", ephemeral=True)
 
 
 class StickyMessages(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.panel_cache: Dict[int, Dict[str, dict]] = {}
-        self.active_channels: Dict[int, dict] = {}
-        self.db_pool = None
+        self.panel_cache: Dict[int, Dict[str, StickyPanel]] = {}
+        self.active_channels: Dict[int, StickyPanel] = {}
+        self.db_pool: Optional[deque] = None
+        self._pool_event = asyncio.Event()
         self.last_message_time: Dict[int, float] = {}
         self.last_activity: Dict[int, float] = {}
         self.sticky_tasks: Dict[int, asyncio.Task] = {}
+        self.embed_cache: Dict[Tuple[int, int], dict] = {}
+        self._pending_message_ids: Dict[Tuple[int, int], int] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._updating: Set[int] = set()
 
     async def cog_load(self):
         await self.init_pools()
@@ -602,25 +652,34 @@ class StickyMessages(commands.Cog):
     async def cog_unload(self):
         if self.sticky_monitor.is_running(): self.sticky_monitor.cancel()
         for t in self.sticky_tasks.values(): t.cancel()
+        if self._flush_task and not self._flush_task.done():
+            await self._flush_task
+        if self._pending_message_ids:
+            await self.flush_last_message_ids()
         if self.db_pool:
-            while not self.db_pool.empty():
-                await (await self.db_pool.get()).close()
+            while self.db_pool:
+                await self.db_pool.popleft().close()
 
     async def init_pools(self, pool_size=6):
         if self.db_pool is None:
-            self.db_pool = asyncio.Queue(maxsize=pool_size)
+            self.db_pool = deque()
             for _ in range(pool_size):
                 conn = await aiosqlite.connect(STICKYDB_PATH)
                 await conn.execute("PRAGMA journal_mode=WAL")
-                await self.db_pool.put(conn)
+                self.db_pool.append(conn)
+            self._pool_event.set()
 
     @asynccontextmanager
     async def acquire_db(self):
-        conn = await self.db_pool.get()
+        while not self.db_pool:
+            self._pool_event.clear()
+            await self._pool_event.wait()
+        conn = self.db_pool.popleft()
         try:
             yield conn
         finally:
-            await self.db_pool.put(conn)
+            self.db_pool.append(conn)
+            self._pool_event.set()
 
     async def init_db(self):
         async with self.acquire_db() as db:
@@ -628,36 +687,84 @@ class StickyMessages(commands.Cog):
                 guild_id INTEGER, panel_id INTEGER, title TEXT, description TEXT, footer TEXT, 
                 image_url TEXT, embed_color TEXT, channel_id INTEGER, last_message_id INTEGER,
                 conversation_duration INTEGER DEFAULT 10, include_bots INTEGER DEFAULT 1,
-                PRIMARY KEY (guild_id, panel_id))''')
+                embed_color_int INTEGER, PRIMARY KEY (guild_id, panel_id))''')
+            async with db.execute("PRAGMA table_info(sticky_panels)") as cursor:
+                columns = {row[1] for row in await cursor.fetchall()}
+            if "embed_color_int" not in columns:
+                await db.execute("ALTER TABLE sticky_panels ADD COLUMN embed_color_int INTEGER")
             await db.commit()
 
     async def populate_caches(self):
+        panel_cache: Dict[int, Dict[str, StickyPanel]] = {}
+        active_channels: Dict[int, StickyPanel] = {}
         async with self.acquire_db() as db:
-            async with db.execute("SELECT * FROM sticky_panels") as cursor:
-                rows = await cursor.fetchall()
-                cols = [c[0] for c in cursor.description]
-                for r in rows:
-                    d = dict(zip(cols, r))
-                    self.panel_cache.setdefault(d["guild_id"], {})[d["title"]] = d
-                    if d["channel_id"]: self.active_channels[d["channel_id"]] = d
-
-    def get_guild_panels(self, guild_id: int) -> List[dict]:
+            async with db.execute(SELECT_PANELS_SQL) as cursor:
+                async for r in cursor:
+                    panel = StickyPanel(*r)
+                    panel_cache.setdefault(panel.guild_id, {})[panel.title] = panel
+                    if panel.channel_id: active_channels[panel.channel_id] = panel
+
+        self.panel_cache = panel_cache
+        self.active_channels = active_channels
+
+    def store_panel(self, panel: StickyPanel):
+        self.panel_cache.setdefault(panel.guild_id, {})[panel.title] = panel
+        if panel.channel_id: self.active_channels[panel.channel_id] = panel
+
+    def get_guild_panels(self, guild_id: int) -> List[StickyPanel]:
         return list(self.panel_cache.get(guild_id, {}).values())
 
     async def delete_panel(self, guild_id: int, title: str):
         panel = self.panel_cache.get(guild_id, {}).pop(title, None)
         if not panel: return
-        self.active_channels.pop(panel['channel_id'], None)
+        self.active_channels.pop(panel.channel_id, None)
+        self.embed_cache.pop((guild_id, panel.panel_id), None)
         async with self.acquire_db() as db:
             await db.execute("DELETE FROM sticky_panels WHERE guild_id = ? AND title = ?", (guild_id, title))
             await db.commit()
 
-    def build_panel_embed(self, data: dict) -> discord.Embed:
-        color = parse_color(data.get('embed_color', ''))
-        embed = discord.Embed(title=data.get('title'), description=data.get('description'),
+    def queue_last_message_id(self, panel: StickyPanel, message_id: int):
+        self._pending_message_ids[(panel.guild_id, panel.panel_id)] = message_id
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush_last_message_ids())
+
+    async def flush_last_message_ids(self):
+        async with self.acquire_db() as db:
+            while self._pending_message_ids:
+                pending, self._pending_message_ids = self._pending_message_ids, {}
+                try:
+                    await db.executemany(
+                        UPDATE_LAST_MESSAGE_SQL,
+                        [(message_id, guild_id, panel_id) for (guild_id, panel_id), message_id in pending.items()]
+                    )
+                    await db.commit()
+                except Exception as e:
+                    # Requeue the failed batch (ids queued meanwhile win), the next queue call retries it
+                    self._pending_message_ids = {**pending, **self._pending_message_ids}
+                    log.warning("Sticky Error: %s", e)
+                    try:
+                        await db.rollback()
+                    except Exception:
+                        pass
+                    return
+
+    def build_panel_embed(self, data: StickyPanel) -> discord.Embed:
+        key = (data.guild_id, data.panel_id)
+        cached = self.embed_cache.get(key)
+        if cached is not None:
+            return discord.Embed.from_dict(cached)
+
+        if data.embed_color_int is not None:
+            color = discord.Color(data.embed_color_int)
+        else:
+            color = parse_color(data.embed_color)
+        embed = discord.Embed(title=data.title, description=data.description,
                               color=color or discord.Color.default())
-        if data.get('image_url'): embed.set_image(url=data['image_url'])
-        if data.get('footer'): embed.set_footer(text=data['footer'])
+        if data.image_url: embed.set_image(url=data.image_url)
+        if data.footer: embed.set_footer(text=data.footer)
+        # An unfixed colour must be rolled again on every repost, so it is never cached
+        if data.embed_color_int is not None:
+            self.embed_cache[key] = embed.to_dict()
         return embed
 
     async def sticky_worker(self, channel, panel, delay):
@@ -678,7 +785,7 @@ class StickyMessages(commands.Cog):
         if not panel:
             return
 
-        if message.author.bot and not panel.get('include_bots', 1):
+        if message.author.bot and not panel.include_bots:
             return
 
         current_time = time.time()
@@ -689,7 +796,7 @@ class StickyMessages(commands.Cog):
             self.sticky_tasks[message.channel.id].cancel()
 
         if (current_time - last_time) < 5.0:
-            delay = panel.get('conversation_duration', 10)
+            delay = panel.conversation_duration
             self.sticky_tasks[message.channel.id] = asyncio.create_task(
                 self.sticky_worker(message.channel, panel, delay)
             )
@@ -699,28 +806,58 @@ class StickyMessages(commands.Cog):
             )
 
     async def update_sticky_message(self, panel, channel):
-        try:
-            if panel.get('last_message_id'):
+        # Callers may hold an older snapshot of the panel, always post the latest one
+        panel = self.active_channels.get(channel.id)
+        if panel is None:
+            return
+
+        async def delete_old():
+            if panel.last_message_id:
                 try:
-                    await (await channel.fetch_message(panel['last_message_id'])).delete()
-                except:
+                    await channel.get_partial_message(panel.last_message_id).delete()
+                except discord.HTTPException:
                     pass
-            new_msg = await channel.send(embed=self.build_panel_embed(panel))
-            async with self.acquire_db() as db:
-                await db.execute("UPDATE sticky_panels SET last_message_id = ? WHERE guild_id = ? AND title = ?",
-                                 (new_msg.id, panel['guild_id'], panel['title']))
-                await db.commit()
-            panel['last_message_id'] = new_msg.id
+
+        self._updating.add(channel.id)
+        try:
+            _, new_msg = await asyncio.gather(delete_old(), channel.send(embed=self.build_panel_embed(panel)))
+            self.queue_last_message_id(panel, new_msg.id)
+            current = self.active_channels.get(channel.id)
+            if current is not None and current.panel_id == panel.panel_id:
+                self.store_panel(replace(current, last_message_id=new_msg.id))
         except Exception as e:
-            print(f"Sticky Error: {e}")
+            log.warning("Sticky Error: %s", e)
+        finally:
+            self._updating.discard(channel.id)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        panel = self.active_channels.get(payload.channel_id)
+        if not panel or panel.last_message_id != payload.message_id:
+            return
+        if payload.channel_id in self.sticky_tasks or payload.channel_id in self._updating:
+            return
+
+        channel = self.bot.get_channel(payload.channel_id)
+        if channel:
+            await self.update_sticky_message(panel, channel)
 
     @tasks.loop(seconds=120)
     async def sticky_monitor(self):
-        for c_id, panel in list(self.active_channels.items()):
-            if c_id in self.sticky_tasks: continue
-            channel = self.bot.get_channel(c_id)
-            if channel and channel.last_message_id != panel.get('last_message_id'):
-                await self.update_sticky_message(panel, channel)
+        # bot.get_channel walks every guild, so resolve each guild once and look channels up on it
+        by_guild: Dict[int, List[Tuple[int, StickyPanel]]] = {}
+        for c_id, panel in self.active_channels.items():
+            if c_id in self.sticky_tasks or c_id in self._updating: continue
+            by_guild.setdefault(panel.guild_id, []).append((c_id, panel))
+
+        for guild_id, entries in by_guild.items():
+            guild = self.bot.get_guild(guild_id)
+            if not guild: continue
+            for c_id, panel in entries:
+                if c_id in self.sticky_tasks or c_id in self._updating: continue
+                channel = guild.get_channel(c_id)
+                if channel and channel.last_message_id != panel.last_message_id:
+                    await self.update_sticky_message(panel, channel)
 
     sticky_group = app_commands.Group(name="sticky", description="Sticky message commands")
 
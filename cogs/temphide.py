@@ -5,10 +5,21 @@ import codecs
 import aiosqlite
 import asyncio
 import time
+import random
+import re
+from itertools import islice
 from contextlib import asynccontextmanager
 from typing import Optional, Dict
 from config import TDB_PATH
 
+WORD_REGEX = re.compile(r'\S+')
+
+TOO_LONG_EMBED = discord.Embed(title="Message Too Long", description="Max 1000 words.", color=discord.Color.red())
+CREATE_FAILED_EMBED = discord.Embed(title="Error", description="Failed to create message.", color=discord.Color.red())
+
+PRAGMAS = ("PRAGMA busy_timeout=5000; PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+           "PRAGMA mmap_size=268435456; PRAGMA temp_store=MEMORY;")
+
 
 class TempHideCog(commands.Cog):
 
@@ -16,6 +27,7 @@ class TempHideCog(commands.Cog):
         self.bot = bot
         self.DB_PATH = TDB_PATH
         self.message_cache: Dict[int, dict] = {}
+        self._reveal_inflight: Dict[int, asyncio.Future] = {}
         self.db_pool: Optional[asyncio.Queue[aiosqlite.Connection]] = None
         self._max_pool_size = 5
 
@@ -31,22 +43,50 @@ class TempHideCog(commands.Cog):
         if self.db_pool:
             while not self.db_pool.empty():
                 conn = await self.db_pool.get()
+                try:
+                    await conn.execute("PRAGMA optimize")
+                except Exception:
+                    pass
+                finally:
+                    await conn.close()
+
+    async def open_connection(self) -> aiosqlite.Connection:
+        # Jittered backoff so connections opened together don't retry a locked DB in lockstep
+        attempt = 0
+        waited = 0.0
+        while True:
+            conn = await aiosqlite.connect(
+                self.DB_PATH,
+                timeout=5,
+                isolation_level=None,
+            )
+            try:
+                await conn.executescript(PRAGMAS)
+                return conn
+            except aiosqlite.OperationalError:
                 await conn.close()
+                delay = random.uniform(0.05, 0.15) * (2 ** attempt)
+                if waited + delay > 2.5:
+                    raise
+                attempt += 1
+                waited += delay
+                await asyncio.sleep(delay)
 
     async def init_pools(self, pool_size: int = 5):
         if self.db_pool is None:
             self.db_pool = asyncio.Queue(maxsize=pool_size)
-            for _ in range(pool_size):
-                conn = await aiosqlite.connect(
-                    self.DB_PATH,
-                    timeout=5,
-                    isolation_level=None,
-                )
-                await conn.execute("PRAGMA busy_timeout=5000")
-                await conn.execute("PRAGMA journal_mode=WAL")
-                await conn.execute("PRAGMA synchronous=NORMAL")
-                await conn.commit()
-                await self.db_pool.put(conn)
+            results = await asyncio.gather(*(self.open_connection() for _ in range(pool_size)),
+                                           return_exceptions=True)
+            error = next((r for r in results if isinstance(r, BaseException)), None)
+            if error is not None:
+                # Don't leak the connections that did open or leave a half-built pool behind
+                for conn in results:
+                    if not isinstance(conn, BaseException):
+                        await conn.close()
+                self.db_pool = None
+                raise error
+            for conn in results:
+                self.db_pool.put_nowait(conn)
 
     @asynccontextmanager
     async def acquire_db(self):
@@ -54,7 +94,7 @@ class TempHideCog(commands.Cog):
         try:
             yield conn
         finally:
-            await self.db_pool.put(conn)
+            self.db_pool.put_nowait(conn)
 
     async def init_db(self):
         async with self.acquire_db() as db:
@@ -98,13 +138,13 @@ class TempHideCog(commands.Cog):
         self.message_cache[message_id] = data
 
     async def delete_message(self, message_id: int):
+        # Drop the cache entry before awaiting the DB so readers see it gone straight away
+        self.message_cache.pop(message_id, None)
+
         async with self.acquire_db() as db:
             await db.execute('DELETE FROM temp_messages WHERE message_id = ?', (message_id,))
             await db.commit()
 
-        if message_id in self.message_cache:
-            del self.message_cache[message_id]
-
     async def get_message(self, message_id: int) -> Optional[tuple[int, str]]:
         data = self.message_cache.get(message_id)
         if data:
@@ -113,14 +153,20 @@ class TempHideCog(commands.Cog):
 
 
     @staticmethod
-    async def send_error_reply(interaction_or_ctx, embed=None, message=None, ephemeral=True):
+    def reply_kind(interaction_or_ctx, is_slash: bool) -> str:
+        if not is_slash:
+            return "ctx"
+        return "interaction_followup" if interaction_or_ctx.response.is_done() else "interaction_initial"
+
+    @staticmethod
+    async def send_error_reply(interaction_or_ctx, *, kind: str, embed=None, message=None, ephemeral=True):
         try:
-            if hasattr(interaction_or_ctx, 'response') and not interaction_or_ctx.response.is_done():
+            if kind == "interaction_initial":
                 if embed:
                     await interaction_or_ctx.response.send_message(embed=embed, ephemeral=ephemeral)
                 else:
                     await interaction_or_ctx.response.send_message(message, ephemeral=ephemeral)
-            elif hasattr(interaction_or_ctx, 'send'):
+            elif kind == "ctx":
                 if embed:
                     await interaction_or_ctx.send(embed=embed)
                 else:
@@ -130,21 +176,21 @@ class TempHideCog(commands.Cog):
                     await interaction_or_ctx.followup.send(embed=embed, ephemeral=ephemeral)
                 else:
                     await interaction_or_ctx.followup.send(message, ephemeral=ephemeral)
-        except:
+        except discord.HTTPException:
             pass
 
     async def handle_temphide(self, interaction_or_ctx, message_text: str):
-        is_slash = hasattr(interaction_or_ctx, 'response')
+        is_slash = isinstance(interaction_or_ctx, discord.Interaction)
         user = interaction_or_ctx.user if is_slash else interaction_or_ctx.author
         channel = interaction_or_ctx.channel
 
-        if len(message_text.split()) > 1000:
-            embed = discord.Embed(title="Message Too Long", description="Max 1000 words.", color=discord.Color.red())
-            await self.send_error_reply(interaction_or_ctx, embed=embed)
+        if sum(1 for _ in islice(WORD_REGEX.finditer(message_text), 1001)) > 1000:
+            await self.send_error_reply(interaction_or_ctx, kind=self.reply_kind(interaction_or_ctx, is_slash),
+                                        embed=TOO_LONG_EMBED)
             return
 
         current_time = time.time()
-        encoded = await asyncio.to_thread(codecs.encode, message_text, 'rot13')
+        encoded = codecs.encode(message_text, 'rot13')
         view = RevealView(self, 0)
 
         try:
@@ -159,8 +205,8 @@ class TempHideCog(commands.Cog):
             if is_slash:
                 await interaction_or_ctx.followup.send("Hidden message created!", ephemeral=True)
         except Exception:
-            embed = discord.Embed(title="Error", description="Failed to create message.", color=discord.Color.red())
-            await self.send_error_reply(interaction_or_ctx, embed=embed)
+            await self.send_error_reply(interaction_or_ctx, kind=self.reply_kind(interaction_or_ctx, is_slash),
+                                        embed=CREATE_FAILED_EMBED)
 
     @app_commands.command(name="temphide", description="Send a hidden message that only you can reveal")
     async def temphide_slash(self, interaction: discord.Interaction, message: str):
@@ -175,7 +221,15 @@ class RevealView(discord.ui.View):
 
     @discord.ui.button(label='Reveal', style=discord.ButtonStyle.primary, custom_id='reveal_button')
     async def reveal_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        message_data = await self.cog.get_message(self.message_id)
+        # The persistent view is registered with message_id 0, so key off the clicked message
+        message_id = interaction.message.id
+        inflight = self.cog._reveal_inflight
+
+        # A double click waits for the reveal already in progress instead of repeating it
+        while (pending := inflight.get(message_id)) is not None:
+            await pending
+
+        message_data = await self.cog.get_message(message_id)
 
         if not message_data:
             return await interaction.response.send_message("Already revealed or expired.", ephemeral=True)
@@ -184,14 +238,19 @@ class RevealView(discord.ui.View):
         if interaction.user.id != user_id:
             return await interaction.response.send_message("Not your message!", ephemeral=True)
 
-        await interaction.response.defer()
+        done = asyncio.get_running_loop().create_future()
+        inflight[message_id] = done
         try:
+            await interaction.response.defer()
             await interaction.message.edit(content=f"{interaction.user.name}: {hidden_text}", view=None)
-            await self.cog.delete_message(self.message_id)
+            await self.cog.delete_message(message_id)
         except discord.NotFound:
-            await self.cog.delete_message(self.message_id)
+            await self.cog.delete_message(message_id)
         except:
             pass
+        finally:
+            del inflight[message_id]
+            done.set_result(None)
 
 
 async def setup(bot):
@@ -4,6 +4,7 @@ from discord.ext import commands
 import aiosqlite
 import asyncio
 import aiohttp
+import re
 import io
 from typing import Optional, Dict, Any
 from contextlib import asynccontextmanager
@@ -12,6 +13,11 @@ from PIL import Image, ImageDraw, ImageFont, ImageOps
 from config import WDB_PATH, WELCOMECARD_PATH, BOLDFONT_PATH, MEDIUMFONT_PATH
 from utils.checks import slash_mod_check
 
+GREETING_CHANNEL_REGEX = re.compile(r"general|chat|lounge", re.IGNORECASE)
+
+PRAGMAS = ("PRAGMA busy_timeout=5000; PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; "
+           "PRAGMA mmap_size=268435456; PRAGMA temp_store=MEMORY;")
+
 def get_ordinal(n):
     if 11 <= (n % 100) <= 13:
         suffix = 'th'
@@ -185,9 +191,10 @@ class CV2Helper(PrivateLayoutView):
             await db.execute(f"UPDATE welcome_settings SET {columns} WHERE guild_id = ?", (*values, self.guild_id))
             await db.commit()
 
-        if self.guild_id not in self.cog.welcome_cache:
-            self.cog.welcome_cache[self.guild_id] = {"guild_id": self.guild_id}
-        self.cog.welcome_cache[self.guild_id].update(kwargs)
+        # Swap in a new dict rather than mutating the cached one, so on_member_join never sees a half-applied update
+        data = dict(self.cog.welcome_cache.get(self.guild_id, {"guild_id": self.guild_id}))
+        data.update(kwargs)
+        self.cog.welcome_cache[self.guild_id] = data
 
         if "image_url" in kwargs:
             self.cog.image_bytes_cache.pop(self.guild_id, None)
@@ -300,13 +307,12 @@ class CV2Helper(PrivateLayoutView):
                 """, (self.guild_id,))
                 await db.commit()
 
-            if self.guild_id in self.cog.welcome_cache:
-                saved_channel = self.cog.welcome_cache[self.guild_id].get("channel_id")
-                saved_enabled = self.cog.welcome_cache[self.guild_id].get("is_enabled")
+            saved = self.cog.welcome_cache.get(self.guild_id)
+            if saved is not None:
                 self.cog.welcome_cache[self.guild_id] = {
                     "guild_id": self.guild_id,
-                    "channel_id": saved_channel,
-                    "is_enabled": saved_enabled,
+                    "channel_id": saved.get("channel_id"),
+                    "is_enabled": saved.get("is_enabled"),
                     "show_text": 1,
                     "show_image": 1
                 }
@@ -444,15 +450,23 @@ class Welcome(commands.Cog):
         await self.init_db()
         await self.populate_caches()
 
+    async def cog_unload(self):
+        if self.db_pool:
+            while not self.db_pool.empty():
+                conn = await self.db_pool.get()
+                try:
+                    await conn.execute("PRAGMA optimize")
+                except Exception:
+                    pass
+                finally:
+                    await conn.close()
+
     async def init_pools(self, pool_size: int = 5):
         if self.db_pool is None:
             self.db_pool = asyncio.Queue(maxsize=pool_size)
             for _ in range(pool_size):
                 conn = await aiosqlite.connect(WDB_PATH, timeout=5)
-                await conn.execute("PRAGMA busy_timeout=5000")
-                await conn.execute("PRAGMA journal_mode=WAL")
-                await conn.execute("PRAGMA synchronous = NORMAL")
-                await conn.commit()
+                await conn.executescript(PRAGMAS)
                 await self.db_pool.put(conn)
 
     @asynccontextmanager
@@ -483,14 +497,15 @@ class Welcome(commands.Cog):
                              )
                              ''')
     async def populate_caches(self):
-        self.welcome_cache.clear()
+        welcome_cache: Dict[int, dict] = {}
         async with self.acquire_db() as db:
             async with db.execute("SELECT * FROM welcome_settings") as cursor:
+                cursor.row_factory = aiosqlite.Row
                 rows = await cursor.fetchall()
-                columns = [column[0] for column in cursor.description]
                 for row in rows:
-                    data = dict(zip(columns, row))
-                    self.welcome_cache[data["guild_id"]] = data
+                    welcome_cache[row["guild_id"]] = dict(row)
+
+        self.welcome_cache = welcome_cache
 
     async def get_background_image(self, guild_id: int, image_url: Optional[str]) -> Image.Image:
 
@@ -654,23 +669,27 @@ class Welcome(commands.Cog):
             icon_url=self.bot.user.display_avatar.url
         )
 
+        # One pass: stop at the first sendable keyword channel, remembering the first sendable one as a fallback
+        me = guild.me
         target_channel = None
-        keywords = ["general", "chat", "lounge"]
+        fallback = None
         for channel in guild.text_channels:
-            if any(word in channel.name.lower() for word in keywords):
-                if channel.permissions_for(guild.me).send_messages:
-                    target_channel = channel
-                    break
+            is_match = GREETING_CHANNEL_REGEX.search(channel.name) is not None
+            if not is_match and fallback is not None:
+                continue
+            if not channel.permissions_for(me).send_messages:
+                continue
+            if is_match:
+                target_channel = channel
+                break
+            fallback = channel
 
         if not target_channel:
-            if guild.system_channel and guild.system_channel.permissions_for(guild.me).send_messages:
-                target_channel = guild.system_channel
-
-        if not target_channel:
-            for channel in guild.text_channels:
-                if channel.permissions_for(guild.me).send_messages:
-                    target_channel = channel
-                    break
+            system_channel = guild.system_channel
+            if system_channel and system_channel.permissions_for(me).send_messages:
+                target_channel = system_channel
+            else:
+                target_channel = fallback
 
         if target_channel:
             await target_channel.send(embed=embed)